@@ -3,4 +3,4 @@ from flask import Blueprint
 api_blueprint = Blueprint('api', __name__)
 
 # Import routes to register them with the blueprint
-from app.api import events
\ No newline at end of file
+from app.api import events, compression
\ No newline at end of file
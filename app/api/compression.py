@@ -0,0 +1,61 @@
+from typing import Any
+
+from flask import current_app, request
+from app.api import api_blueprint
+from app.utils.compression import ZSTD, compress, decompress, negotiate_encoding, stream_compress
+from app.utils.validators import ValidationError
+
+
+def get_request_json() -> Any:
+    """Return the JSON request body, decoding any Content-Encoding first"""
+    if not request.is_json:
+        raise ValidationError("Request body must be JSON (Content-Type: application/json)")
+
+    body = decompress(
+        request.get_data(cache=False),
+        request.headers.get("Content-Encoding"),
+        current_app.config["MAX_DECOMPRESSED_REQUEST_SIZE"]
+    )
+
+    try:
+        return request.json_module.loads(body)
+    except ValueError:
+        raise ValidationError("Request body is not valid JSON")
+
+
+def _compression_level(encoding: str) -> int:
+    if encoding == ZSTD:
+        return current_app.config["COMPRESSION_ZSTD_LEVEL"]
+    return current_app.config["COMPRESSION_GZIP_LEVEL"]
+
+
+@api_blueprint.after_request
+def compress_response(response):
+    """Compress the response body based on the client's Accept-Encoding"""
+    response.vary.add("Accept-Encoding")
+
+    # Leave alone bodies that are empty, already encoded or served as files
+    if (response.status_code < 200
+            or response.status_code in (204, 304)
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers):
+        return response
+
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+    if encoding is None:
+        return response
+
+    level = _compression_level(encoding)
+
+    if response.is_streamed:
+        # Compress chunks as they are produced instead of buffering the body
+        response.response = stream_compress(response.iter_encoded(), encoding, level)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < current_app.config["COMPRESSION_MIN_SIZE"]:
+            return response
+        response.set_data(compress(data, encoding, level))
+
+    response.headers["Content-Encoding"] = encoding
+    return response
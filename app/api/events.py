@@ -1,6 +1,9 @@
-from flask import request, jsonify
+from itertools import chain
+from flask import Response, current_app, request, jsonify, stream_with_context
 from app.api import api_blueprint
+from app.api.compression import get_request_json
 from app.services.event_service import EventService
+from app.utils.export import stream_events
 from app.utils.validators import ValidationError
 
 event_service = EventService()
@@ -10,7 +13,7 @@ event_service = EventService()
 def create_event():
     """Endpoint to receive and store events"""
     try:
-        event_data = request.json
+        event_data = get_request_json()
 
         # Process the event using the service
         event_service.process_event(event_data)
@@ -33,14 +36,23 @@ def get_events():
         start_date = request.args.get('start_date')
         end_date = request.args.get('end_date')
 
-        # Get filtered events using the service
-        filtered_events = event_service.get_filtered_events(
+        # Get filtered events using the service; the events themselves are
+        # read from the database as the export is streamed
+        filtered_events = event_service.iter_filtered_events(
             customer_id=customer_id,
             start_date=start_date,
             end_date=end_date
         )
 
-        return jsonify({"status": "success", "events": filtered_events}), 200
+        # Run the query before responding, so connection and query errors
+        # still produce an error response. Once streaming has started the
+        # status is sent, and a failure can only cut the export short.
+        first_event = next(filtered_events, None)
+        if first_event is not None:
+            filtered_events = chain([first_event], filtered_events)
+
+        export = stream_events(filtered_events, current_app.config["EXPORT_BATCH_SIZE"])
+        return Response(stream_with_context(export), status=200, mimetype="application/json")
 
     except ValidationError as e:
         return jsonify({"status": "error", "message": str(e)}), 400
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 from app.models.event import Event
 from app import mongo
@@ -84,6 +84,15 @@ class EventRepository:
             end_date: Optional[datetime] = None
     ) -> List[Event]:
         """Find events by customer ID and date range"""
+        return list(self.iter_by_customer_and_date_range(customer_id, start_date, end_date))
+
+    def iter_by_customer_and_date_range(
+            self,
+            customer_id: Optional[str] = None,
+            start_date: Optional[datetime] = None,
+            end_date: Optional[datetime] = None
+    ) -> Iterator[Event]:
+        """Lazily iterate events by customer ID and date range, without loading them all"""
         # Build query based on provided filters
         query = {}
 
@@ -104,7 +113,7 @@ class EventRepository:
 
         # Execute query
         cursor = self.collection.find(query)
-        return [Event.from_mongo_document(doc) for doc in cursor]
+        return (Event.from_mongo_document(doc) for doc in cursor)
 
     def find_by_event_id(self, event_id: str) -> Optional[Event]:
         """Find an event by its event_id"""
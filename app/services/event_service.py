@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterator, Optional
 from app.models.event import Event
 from app.repositories.event_repository import EventRepository
 from app.utils.validators import validate_event, validate_uuid
@@ -32,6 +32,19 @@ class EventService:
             end_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get events filtered by customer_id and date range"""
+        return list(self.iter_filtered_events(customer_id, start_date, end_date))
+
+    def iter_filtered_events(
+            self,
+            customer_id: Optional[str] = None,
+            start_date: Optional[str] = None,
+            end_date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate events filtered by customer_id and date range
+
+        Filters are validated immediately, before any event is read.
+        """
         # Validate customer_id if provided
         if customer_id:
             validate_uuid(customer_id, "customer_id")
@@ -41,11 +54,11 @@ class EventService:
         end_datetime = parse_date(end_date) if end_date else None
 
         # Get filtered events from repository
-        filtered_events = self.repository.find_by_customer_and_date_range(
+        filtered_events = self.repository.iter_by_customer_and_date_range(
             customer_id=customer_id,
             start_date=start_datetime,
             end_date=end_datetime
         )
 
         # Convert events to dictionaries
-        return [event.to_dict() for event in filtered_events]
\ No newline at end of file
+        return (event.to_dict() for event in filtered_events)
\ No newline at end of file
@@ -0,0 +1,149 @@
+import gzip
+import json
+import unittest
+import zlib
+from unittest.mock import patch
+
+from app import create_app
+from app.utils.compression import compress, decompress
+
+EVENT = {
+    "event_id": "3176f293-8285-4ba0-a389-e3569069715a",
+    "event_type": "purchase",
+    "customer_id": "3176f293-8285-4ba0-a389-e3569069715a",
+    "timestamp": "2025-01-27T13:38:03Z",
+    "email_id": "a3b8180c-9989-464f-9880-d518a0fac1a9",
+    "product_id": "e42563d1-23e0-4442-9494-f1bb5d983516",
+    "amount": 49.99
+}
+
+
+# These tests live outside app/api because importing that package creates the
+# module-level EventService, which needs MongoDB; create_app imports it here
+# with the repository patched out instead
+class TestCompressionApi(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with patch("app.services.event_service.EventRepository"):
+            cls.app = create_app("testing")
+
+    def setUp(self):
+        self.client = self.app.test_client()
+
+        service_patcher = patch("app.api.events.event_service")
+        self.event_service = service_patcher.start()
+        self.addCleanup(service_patcher.stop)
+
+        self.event_service.iter_filtered_events.side_effect = lambda **kwargs: iter([EVENT] * 100)
+
+    def post_event(self, data, content_encoding=None, content_type="application/json"):
+        headers = {"Content-Type": content_type}
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return self.client.post("/events", data=data, headers=headers)
+
+    def test_compressed_export(self):
+        # Test the export is compressed with the negotiated coding
+        for encoding in ("gzip", "zstd"):
+            response = self.client.get("/events", headers={"Accept-Encoding": encoding})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers["Content-Encoding"], encoding)
+            self.assertIn("Accept-Encoding", response.headers["Vary"])
+            self.assertNotIn("Content-Length", response.headers)
+
+            body = json.loads(decompress(response.data, encoding, 10 * 1024 * 1024))
+            self.assertEqual(body, {"status": "success", "events": [EVENT] * 100})
+
+    def test_streamed_export_decodes_incrementally(self):
+        # Test every streamed chunk can be decoded as soon as it arrives
+        self.addCleanup(self.app.config.__setitem__, "EXPORT_BATCH_SIZE", self.app.config["EXPORT_BATCH_SIZE"])
+        self.app.config["EXPORT_BATCH_SIZE"] = 10
+
+        response = self.client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = [decoder.decompress(chunk) for chunk in response.response]
+
+        self.assertEqual(chunks[0], b'{"events":[')
+        self.assertGreater(len(chunks), 10)
+        self.assertTrue(all(chunks[:-1]))
+        self.assertEqual(json.loads(b"".join(chunks))["events"], [EVENT] * 100)
+
+    def test_export_query_error(self):
+        # Test database errors surface as a JSON 500 rather than a broken stream
+        def failing_events(**kwargs):
+            raise RuntimeError("MongoDB is unreachable")
+            yield
+
+        self.event_service.iter_filtered_events.side_effect = failing_events
+        response = self.client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json["status"], "error")
+        self.assertIn("MongoDB is unreachable", response.json["message"])
+
+    def test_empty_export(self):
+        # Test an export with no matching events is still a valid document
+        self.event_service.iter_filtered_events.side_effect = lambda **kwargs: iter([])
+        response = self.client.get("/events")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json, {"status": "success", "events": []})
+
+    def test_no_accept_encoding(self):
+        # Test responses stay uncompressed when the client does not ask for it
+        response = self.client.get("/events")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(response.json["events"], [EVENT] * 100)
+
+    def test_small_response_uncompressed(self):
+        # Test responses below COMPRESSION_MIN_SIZE are sent as is
+        response = self.post_event(json.dumps(EVENT))
+
+        self.assertEqual(response.status_code, 201)
+        self.assertLess(len(response.data), self.app.config["COMPRESSION_MIN_SIZE"])
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_compressed_post(self):
+        # Test gzip and zstd request bodies are decoded before processing
+        for encoding in ("gzip", "zstd"):
+            response = self.post_event(compress(json.dumps(EVENT).encode(), encoding, 3), encoding)
+
+            self.assertEqual(response.status_code, 201)
+            self.event_service.process_event.assert_called_with(EVENT)
+
+    def test_corrupt_post(self):
+        # Test undecodable bodies are rejected as bad requests
+        response = self.post_event(b"not compressed", "gzip")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Invalid gzip request body", response.json["message"])
+        self.event_service.process_event.assert_not_called()
+
+    def test_oversized_post(self):
+        # Test bodies expanding past MAX_DECOMPRESSED_REQUEST_SIZE are rejected
+        padded = dict(EVENT, padding=" " * self.app.config["MAX_DECOMPRESSED_REQUEST_SIZE"])
+        response = self.post_event(gzip.compress(json.dumps(padded).encode()), "gzip")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("exceeds", response.json["message"])
+        self.event_service.process_event.assert_not_called()
+
+    def test_invalid_json_post(self):
+        # Test bodies that decode to invalid JSON are rejected
+        response = self.post_event(gzip.compress(b"{not json"), "gzip")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("not valid JSON", response.json["message"])
+
+    def test_non_json_content_type(self):
+        # Test the Content-Type is checked with and without a Content-Encoding
+        for content_encoding in (None, "identity"):
+            response = self.post_event(json.dumps(EVENT), content_encoding, content_type="text/plain")
+
+            self.assertEqual(response.status_code, 400)
+            self.assertIn("must be JSON", response.json["message"])
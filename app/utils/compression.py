@@ -0,0 +1,180 @@
+import gzip
+import zlib
+from typing import Iterable, Iterator, List, Optional
+
+import zstandard
+
+from app.utils.validators import ValidationError
+
+GZIP = "gzip"
+ZSTD = "zstd"
+IDENTITY = "identity"
+
+# Codings we can produce, in server preference order
+SUPPORTED_ENCODINGS = [ZSTD, GZIP]
+
+# A zstd block decodes to at most 128 KiB, and the densest block (RLE) takes
+# 4 bytes of input, which bounds how far a piece of input can expand
+_ZSTD_MAX_BLOCK_SIZE = 128 * 1024
+_ZSTD_MIN_BLOCK_INPUT = 4
+
+
+def parse_accept_encoding(header: Optional[str]) -> List[tuple]:
+    """Parse an Accept-Encoding header into (coding, quality) pairs"""
+    codings = []
+    if not header:
+        return codings
+
+    for item in header.split(","):
+        parts = [part.strip() for part in item.split(";")]
+        coding = parts[0].lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in parts[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        codings.append((coding, quality))
+
+    return codings
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the content coding to use for a response
+
+    Returns:
+        Optional[str]: The chosen coding, or None to send the body uncompressed
+    """
+    qualities = dict(parse_accept_encoding(accept_encoding))
+    wildcard = qualities.get("*", 0.0)
+
+    best, best_quality = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress a complete body with the given content coding"""
+    if encoding == GZIP:
+        return gzip.compress(data, compresslevel=level)
+
+    if encoding == ZSTD:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def stream_compress(chunks: Iterable[bytes], encoding: str, level: int) -> Iterator[bytes]:
+    """
+    Compress a streamed body chunk by chunk without buffering it whole
+
+    Each input chunk is flushed as soon as it is compressed, so clients can
+    decode the stream incrementally. Producers should yield reasonably large
+    chunks, since every flush costs some compression ratio.
+    """
+    if encoding == GZIP:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        flush_mode = zlib.Z_SYNC_FLUSH
+    elif encoding == ZSTD:
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+    else:
+        raise ValueError(f"Unsupported content encoding: {encoding}")
+
+    for chunk in chunks:
+        if chunk:
+            yield compressor.compress(chunk) + compressor.flush(flush_mode)
+
+    yield compressor.flush()
+
+
+def _decompress_gzip(data: bytes, max_size: int) -> bytes:
+    parts, size = [], 0
+    try:
+        # A gzip body may hold several concatenated members
+        while True:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            parts.append(decompressor.decompress(data, max_size + 1 - size))
+            size += len(parts[-1])
+
+            if size > max_size:
+                raise ValidationError(f"Decompressed request body exceeds {max_size} bytes")
+
+            if not decompressor.eof:
+                raise ValidationError("Invalid gzip request body: truncated stream")
+
+            data = decompressor.unused_data
+            if not data:
+                break
+    except zlib.error as e:
+        raise ValidationError(f"Invalid gzip request body: {str(e)}")
+
+    return b"".join(parts)
+
+
+def _decompress_zstd(data: bytes, max_size: int) -> bytes:
+    parts, size, offset = [], 0, 0
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    try:
+        while offset < len(data):
+            # The decompressor returns all the output its input produces, so
+            # feed only as much input as the remaining headroom allows. Each
+            # full block needs at least _ZSTD_MIN_BLOCK_INPUT bytes, which keeps
+            # the output within a couple of blocks of the cap.
+            headroom = max_size + 1 - size
+            piece = max(1, headroom // _ZSTD_MAX_BLOCK_SIZE) * _ZSTD_MIN_BLOCK_INPUT
+            parts.append(decompressor.decompress(data[offset:offset + piece]))
+            size += len(parts[-1])
+            offset += piece
+
+            if size > max_size:
+                raise ValidationError(f"Decompressed request body exceeds {max_size} bytes")
+
+            # A zstd body may hold several concatenated frames
+            if decompressor.eof:
+                offset -= len(decompressor.unused_data)
+                if offset < len(data):
+                    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    except zstandard.ZstdError as e:
+        raise ValidationError(f"Invalid zstd request body: {str(e)}")
+
+    if not decompressor.eof:
+        raise ValidationError("Invalid zstd request body: truncated stream")
+
+    return b"".join(parts)
+
+
+def decompress(data: bytes, content_encoding: Optional[str], max_size: int) -> bytes:
+    """
+    Undo the content codings listed in a Content-Encoding header
+
+    Codings are removed in the reverse of the order they were applied, and the
+    decoded body is capped at max_size bytes to guard against compression bombs.
+    """
+    if not content_encoding:
+        return data
+
+    codings = [coding.strip().lower() for coding in content_encoding.split(",")]
+
+    for coding in reversed(codings):
+        if coding in ("", IDENTITY):
+            continue
+        elif coding in (GZIP, "x-gzip"):
+            data = _decompress_gzip(data, max_size)
+        elif coding == ZSTD:
+            data = _decompress_zstd(data, max_size)
+        else:
+            raise ValidationError(f"Unsupported Content-Encoding: {coding}")
+
+    return data
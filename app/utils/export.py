@@ -0,0 +1,19 @@
+from typing import Any, Dict, Iterator
+from flask import json
+
+
+def stream_events(events: Iterator[Dict[str, Any]], batch_size: int) -> Iterator[str]:
+    """Serialize an events export incrementally, a batch of events per chunk"""
+    yield '{"events":['
+
+    separator, batch = "", []
+    for event in events:
+        batch.append(json.dumps(event, separators=(",", ":")))
+        if len(batch) == batch_size:
+            yield separator + ",".join(batch)
+            separator, batch = ",", []
+
+    if batch:
+        yield separator + ",".join(batch)
+
+    yield '],"status":"success"}\n'
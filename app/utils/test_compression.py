@@ -0,0 +1,144 @@
+import gzip
+import tracemalloc
+import unittest
+import zlib
+
+import zstandard
+
+from app.utils.validators import ValidationError
+from app.utils.compression import compress, decompress, negotiate_encoding, stream_compress
+
+PAYLOAD = b'{"event_id": "3176f293-8285-4ba0-a389-e3569069715a", "event_type": "email_open"}' * 50
+
+
+def build_bomb(encoding: str, megabytes: int) -> bytes:
+    """Compress megabytes of zeros a chunk at a time, without holding them in memory"""
+    if encoding == "gzip":
+        compressor = zlib.compressobj(9, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    else:
+        compressor = zstandard.ZstdCompressor(level=9).compressobj()
+
+    chunk = b"\0" * (1024 * 1024)
+    return b"".join(compressor.compress(chunk) for _ in range(megabytes)) + compressor.flush()
+
+
+class TestNegotiateEncoding(unittest.TestCase):
+    def test_no_header(self):
+        # Test missing Accept-Encoding means no compression
+        self.assertIsNone(negotiate_encoding(None))
+        self.assertIsNone(negotiate_encoding(""))
+
+    def test_prefers_zstd(self):
+        # Test zstd wins over gzip when both are equally acceptable
+        self.assertEqual(negotiate_encoding("gzip, deflate, br, zstd"), "zstd")
+
+    def test_gzip_only(self):
+        # Test unsupported codings are ignored
+        self.assertEqual(negotiate_encoding("gzip, deflate, br"), "gzip")
+
+    def test_quality_values(self):
+        # Test client quality values override server preference
+        self.assertEqual(negotiate_encoding("zstd;q=0.5, gzip;q=0.8"), "gzip")
+        self.assertIsNone(negotiate_encoding("zstd;q=0, gzip;q=0"))
+
+    def test_wildcard(self):
+        # Test wildcard accepts any coding not listed explicitly
+        self.assertEqual(negotiate_encoding("*"), "zstd")
+        self.assertEqual(negotiate_encoding("zstd;q=0, *"), "gzip")
+
+
+class TestCompression(unittest.TestCase):
+    def test_round_trip(self):
+        # Test compressed bodies decode back to the original
+        for encoding in ("gzip", "zstd"):
+            compressed = compress(PAYLOAD, encoding, 3)
+            self.assertLess(len(compressed), len(PAYLOAD))
+            self.assertEqual(decompress(compressed, encoding, len(PAYLOAD)), PAYLOAD)
+
+    def test_stream_round_trip(self):
+        # Test streamed output decodes to the concatenated chunks
+        chunks = [PAYLOAD[i:i + 100] for i in range(0, len(PAYLOAD), 100)]
+        for encoding in ("gzip", "zstd"):
+            compressed = b"".join(stream_compress(iter(chunks), encoding, 3))
+            self.assertEqual(decompress(compressed, encoding, len(PAYLOAD)), PAYLOAD)
+
+    def test_stream_flushes_each_chunk(self):
+        # Test each chunk can be decoded before the stream is finished
+        gzip_decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        zstd_decoder = zstandard.ZstdDecompressor().decompressobj()
+        for encoding, decoder in (("gzip", gzip_decoder), ("zstd", zstd_decoder)):
+            stream = stream_compress(iter([PAYLOAD, PAYLOAD]), encoding, 3)
+            self.assertEqual(decoder.decompress(next(stream)), PAYLOAD)
+
+    def test_gzip_interoperates_with_stdlib(self):
+        # Test bodies compressed by other gzip clients are accepted
+        self.assertEqual(decompress(gzip.compress(PAYLOAD), "gzip", len(PAYLOAD)), PAYLOAD)
+
+    def test_stacked_encodings(self):
+        # Test codings are removed in reverse order of application
+        compressed = compress(compress(PAYLOAD, "gzip", 6), "zstd", 3)
+        self.assertEqual(decompress(compressed, "gzip, zstd", len(PAYLOAD)), PAYLOAD)
+
+    def test_identity(self):
+        # Test missing or identity coding leaves the body untouched
+        self.assertEqual(decompress(PAYLOAD, None, 0), PAYLOAD)
+        self.assertEqual(decompress(PAYLOAD, "identity", 0), PAYLOAD)
+
+    def test_unsupported_encoding(self):
+        # Test unknown Content-Encoding values are rejected
+        with self.assertRaises(ValidationError) as context:
+            decompress(PAYLOAD, "br", len(PAYLOAD))
+        self.assertIn("Unsupported Content-Encoding", str(context.exception))
+
+    def test_size_limit(self):
+        # Test bodies expanding past the limit are rejected
+        for encoding in ("gzip", "zstd"):
+            with self.assertRaises(ValidationError) as context:
+                decompress(compress(PAYLOAD, encoding, 3), encoding, len(PAYLOAD) - 1)
+            self.assertIn("exceeds", str(context.exception))
+
+    def test_compression_bomb(self):
+        # Test a tiny body expanding to 200 MB is rejected without decoding it whole
+        max_size = 1024 * 1024
+        for encoding in ("gzip", "zstd"):
+            bomb = build_bomb(encoding, 200)
+            self.assertLess(len(bomb), 300 * 1024)
+
+            tracemalloc.start()
+            try:
+                with self.assertRaises(ValidationError) as context:
+                    decompress(bomb, encoding, max_size)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+            self.assertIn("exceeds", str(context.exception))
+            # Memory must stay proportional to the cap, however far the body expands
+            self.assertLess(peak, 3 * max_size)
+
+    def test_concatenated_members(self):
+        # Test every gzip member or zstd frame in a body is decoded
+        for encoding in ("gzip", "zstd"):
+            compressed = compress(PAYLOAD, encoding, 3) + compress(PAYLOAD, encoding, 3)
+            self.assertEqual(decompress(compressed, encoding, 2 * len(PAYLOAD)), PAYLOAD * 2)
+
+            # The cap applies to the whole body, not to each member
+            with self.assertRaises(ValidationError) as context:
+                decompress(compressed, encoding, 2 * len(PAYLOAD) - 1)
+            self.assertIn("exceeds", str(context.exception))
+
+    def test_trailing_garbage(self):
+        # Test data after the last member or frame is rejected
+        for encoding in ("gzip", "zstd"):
+            with self.assertRaises(ValidationError):
+                decompress(compress(PAYLOAD, encoding, 3) + b"garbage", encoding, len(PAYLOAD))
+
+    def test_corrupt_body(self):
+        # Test garbage and truncated bodies are rejected
+        for encoding in ("gzip", "zstd"):
+            with self.assertRaises(ValidationError):
+                decompress(b"not compressed", encoding, len(PAYLOAD))
+
+            with self.assertRaises(ValidationError) as context:
+                decompress(compress(PAYLOAD, encoding, 3)[:-8], encoding, len(PAYLOAD))
+            self.assertIn("truncated", str(context.exception))
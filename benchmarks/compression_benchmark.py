@@ -0,0 +1,125 @@
+"""
+Benchmark HTTP compression of event payloads
+
+Builds a realistic GET /events export, serialized and compressed in
+EXPORT_BATCH_SIZE chunks exactly as the endpoint streams it, and measures,
+for every supported content coding, the bytes on the wire and the end-to-end
+time to compress, transfer and decompress it over a link of the given
+bandwidth.
+
+Usage:
+    python -m benchmarks.compression_benchmark [--events N] [--mbps BANDWIDTH]
+"""
+import argparse
+import gzip
+import random
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+import zstandard
+
+from app.models.event import Event
+from app.utils.compression import stream_compress
+from app.utils.datetime_utils import normalize_timestamp
+from app.utils.export import stream_events
+from config import Config
+
+EVENT_TYPES = ["email_open", "email_click", "email_unsubscribe", "purchase"]
+
+# What a client does with the response; the server-side request decoder adds
+# size and truncation checks a client would not run. Streamed zstd frames do
+# not record their content size, so they need the streaming decoder.
+CLIENT_DECOMPRESSORS = {
+    "gzip": gzip.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+}
+
+
+def generate_events(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate events shaped like the ones posted to the API"""
+    rng = random.Random(seed)
+
+    def new_uuid() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    customers = [new_uuid() for _ in range(max(1, count // 100))]
+    emails = [new_uuid() for _ in range(max(1, count // 20))]
+    products = [new_uuid() for _ in range(50)]
+
+    events = []
+    for i in range(count):
+        event_type = rng.choice(EVENT_TYPES)
+        event = {
+            "event_id": new_uuid(),
+            "event_type": event_type,
+            "customer_id": rng.choice(customers),
+            "timestamp": f"2025-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:"
+                         f"{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z",
+            "email_id": rng.choice(emails)
+        }
+
+        if event_type == "email_click":
+            event["clicked_link"] = f"https://example.com/campaign/{rng.randint(1, 20)}"
+
+        if event_type == "purchase":
+            event["product_id"] = rng.choice(products)
+            event["amount"] = round(rng.uniform(5, 500), 2)
+
+        events.append(event)
+
+    return events
+
+
+def _best_time(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(event_count: int, mbps: float, repeat: int = 5) -> None:
+    # Serialize the export as GET /events returns it from stored events
+    events = (
+        Event.from_dict(event, normalize_timestamp(event["timestamp"])).to_dict()
+        for event in generate_events(event_count)
+    )
+    chunks = [chunk.encode() for chunk in stream_events(events, Config.EXPORT_BATCH_SIZE)]
+    body = b"".join(chunks)
+    bytes_per_second = mbps * 1_000_000 / 8
+    raw_transfer = len(body) / bytes_per_second
+
+    print(f"{event_count} events, {len(body)} bytes uncompressed, {mbps:g} Mbit/s link")
+    print(f"{'encoding':<10}{'level':>6}{'bytes':>12}{'ratio':>8}"
+          f"{'comp ms':>10}{'decomp ms':>11}{'total ms':>10}{'saved ms':>10}")
+    print(f"{'identity':<10}{'-':>6}{len(body):>12}{1:>8.2f}"
+          f"{0:>10.2f}{0:>11.2f}{raw_transfer * 1000:>10.2f}{0:>10.2f}")
+
+    cases = [
+        ("gzip", 1), ("gzip", Config.COMPRESSION_GZIP_LEVEL), ("gzip", 9),
+        ("zstd", 1), ("zstd", Config.COMPRESSION_ZSTD_LEVEL), ("zstd", 19)
+    ]
+    for encoding, level in cases:
+        def compress_stream() -> bytes:
+            return b"".join(stream_compress(chunks, encoding, level))
+
+        compressed = compress_stream()
+        compress_time = _best_time(compress_stream, repeat)
+        client_decompress = CLIENT_DECOMPRESSORS[encoding]
+        decompress_time = _best_time(lambda: client_decompress(compressed), repeat)
+        total = compress_time + len(compressed) / bytes_per_second + decompress_time
+
+        print(f"{encoding:<10}{level:>6}{len(compressed):>12}{len(body) / len(compressed):>8.2f}"
+              f"{compress_time * 1000:>10.2f}{decompress_time * 1000:>11.2f}"
+              f"{total * 1000:>10.2f}{(raw_transfer - total) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--events", type=int, default=10000, help="number of events in the export")
+    arg_parser.add_argument("--mbps", type=float, default=100.0, help="link bandwidth in Mbit/s")
+    args = arg_parser.parse_args()
+
+    run(args.events, args.mbps)
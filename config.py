@@ -20,6 +20,16 @@ class Config:
     MONGO_AUTH_SOURCE = mongodb_config["auth_source"]
     MONGO_DBNAME = "email_events"
 
+    # HTTP compression settings
+    COMPRESSION_GZIP_LEVEL = 6
+    COMPRESSION_ZSTD_LEVEL = 3
+    # Responses smaller than this are sent uncompressed
+    COMPRESSION_MIN_SIZE = 500
+    # Upper bound on a decompressed request body, to guard against compression bombs
+    MAX_DECOMPRESSED_REQUEST_SIZE = 10 * 1024 * 1024
+    # Number of events serialized per streamed chunk of a GET /events export
+    EXPORT_BATCH_SIZE = 200
+
     # Construct MongoDB URI from components
     @property
     def MONGO_URI(self):